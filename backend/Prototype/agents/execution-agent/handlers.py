@@ -2,13 +2,23 @@
 Playwright action handlers for browser automation.
 
 Each handler executes a specific browser action and returns a structured result.
+Results are built with ExecutionOutput.model_construct, skipping Pydantic
+validation: each handler produces every field itself with a fixed type (the
+status and error_type literals, the int timing, the message string and the
+args dict of the values it was called with), so there is nothing to coerce.
 """
 
 import asyncio
+import time
 from playwright.async_api import Page
 from models import ExecutionOutput
 
 
+def _elapsed_ms(start: int) -> int:
+    """Whole milliseconds elapsed since a time.perf_counter_ns() mark."""
+    return (time.perf_counter_ns() - start) // 1_000_000
+
+
 async def handle_navigate(page: Page, url: str) -> ExecutionOutput:
     """
     Navigate to a URL.
@@ -20,13 +30,13 @@ async def handle_navigate(page: Page, url: str) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
         await page.goto(url, timeout=10000)
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="navigate",
             args={"url": url},
             status="success",
@@ -35,9 +45,9 @@ async def handle_navigate(page: Page, url: str) -> ExecutionOutput:
             execution_time_ms=elapsed
         )
     except Exception as e:
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="navigate",
             args={"url": url},
             status="failure",
@@ -59,60 +69,45 @@ async def handle_click(page: Page, role: str, name: str) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
+        # Pick the most specific locator available, then click it once
         if role and name:
-            await page.get_by_role(role, name=name).click(timeout=3000)
-            elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-            return ExecutionOutput(
-                action="click",
-                args={"role": role, "name": name},
-                status="success",
-                error_type="none",
-                message=f"Clicked {role} '{name}'",
-                execution_time_ms=elapsed
-            )
-
-
-        if role:
-            await page.get_by_role(role).click(timeout=3000)
-            elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-            return ExecutionOutput(
+            locator = page.get_by_role(role, name=name)
+            target = f"{role} '{name}'"
+        elif role:
+            locator = page.get_by_role(role)
+            target = role
+        elif name:
+            locator = page.get_by_text(name)
+            target = f"element with text '{name}'"
+        else:
+            # No valid target
+            elapsed = _elapsed_ms(start)
+            return ExecutionOutput.model_construct(
                 action="click",
                 args={"role": role, "name": name},
-                status="success",
-                error_type="none",
-                message=f"Clicked {role}",
-                execution_time_ms=elapsed
-            )
-
-        if name:
-            await page.get_by_text(name).click(timeout=3000)
-            elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-            return ExecutionOutput(
-                action="click",
-                args={"role": role, "name": name},
-                status="success",
-                error_type="none",
-                message=f"Clicked element with text '{name}'",
+                status="failure",
+                error_type="ambiguous_step",
+                message="No role or name provided for click",
                 execution_time_ms=elapsed
             )
 
-        # No valid target
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-        return ExecutionOutput(
+        await locator.click(timeout=3000)
+        elapsed = _elapsed_ms(start)
+        return ExecutionOutput.model_construct(
             action="click",
             args={"role": role, "name": name},
-            status="failure",
-            error_type="ambiguous_step",
-            message="No role or name provided for click",
+            status="success",
+            error_type="none",
+            message=f"Clicked {target}",
             execution_time_ms=elapsed
         )
 
     except Exception as e:
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-        return ExecutionOutput(
+        elapsed = _elapsed_ms(start)
+        return ExecutionOutput.model_construct(
             action="click",
             args={"role": role, "name": name},
             status="failure",
@@ -133,13 +128,13 @@ async def handle_type(page: Page, text: str) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
         await page.keyboard.type(text)
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="type",
             args={"text": text},
             status="success",
@@ -148,9 +143,9 @@ async def handle_type(page: Page, text: str) -> ExecutionOutput:
             execution_time_ms=elapsed
         )
     except Exception as e:
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="type",
             args={"text": text},
             status="failure",
@@ -171,16 +166,15 @@ async def handle_search(page: Page, query: str) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
-        search_box = page.get_by_role("combobox", name="Search")
-        await search_box.click()
-        await search_box.fill(query)
+        # fill() already waits for and focuses the box, so no separate click
+        await page.get_by_role("combobox", name="Search").fill(query)
         await page.keyboard.press("Enter")
 
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-        return ExecutionOutput(
+        elapsed = _elapsed_ms(start)
+        return ExecutionOutput.model_construct(
             action="search",
             args={"text": query},
             status="success",
@@ -193,8 +187,8 @@ async def handle_search(page: Page, query: str) -> ExecutionOutput:
             await page.keyboard.type(query)
             await page.keyboard.press("Enter")
 
-            elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-            return ExecutionOutput(
+            elapsed = _elapsed_ms(start)
+            return ExecutionOutput.model_construct(
                 action="search",
                 args={"text": query},
                 status="success",
@@ -203,8 +197,8 @@ async def handle_search(page: Page, query: str) -> ExecutionOutput:
                 execution_time_ms=elapsed
             )
         except Exception as e:
-            elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-            return ExecutionOutput(
+            elapsed = _elapsed_ms(start)
+            return ExecutionOutput.model_construct(
                 action="search",
                 args={"text": query},
                 status="failure",
@@ -225,14 +219,14 @@ async def handle_scroll(page: Page, direction: str) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
         delta = 800 if direction.lower() == "down" else -800
         await page.mouse.wheel(0, delta)
 
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-        return ExecutionOutput(
+        elapsed = _elapsed_ms(start)
+        return ExecutionOutput.model_construct(
             action="scroll",
             args={"direction": direction},
             status="success",
@@ -241,9 +235,9 @@ async def handle_scroll(page: Page, direction: str) -> ExecutionOutput:
             execution_time_ms=elapsed
         )
     except Exception as e:
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="scroll",
             args={"direction": direction},
             status="failure",
@@ -264,13 +258,13 @@ async def handle_press_key(page: Page, key: str) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
         await page.keyboard.press(key)
 
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-        return ExecutionOutput(
+        elapsed = _elapsed_ms(start)
+        return ExecutionOutput.model_construct(
             action="press_key",
             args={"key": key},
             status="success",
@@ -279,9 +273,9 @@ async def handle_press_key(page: Page, key: str) -> ExecutionOutput:
             execution_time_ms=elapsed
         )
     except Exception as e:
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="press_key",
             args={"key": key},
             status="failure",
@@ -302,13 +296,13 @@ async def handle_wait(page: Page, seconds: float) -> ExecutionOutput:
     Returns:
         ExecutionOutput with result
     """
-    start = asyncio.get_event_loop().time()
+    start = time.perf_counter_ns()
 
     try:
         await asyncio.sleep(seconds)
 
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
-        return ExecutionOutput(
+        elapsed = _elapsed_ms(start)
+        return ExecutionOutput.model_construct(
             action="wait",
             args={"seconds": seconds},
             status="success",
@@ -317,9 +311,9 @@ async def handle_wait(page: Page, seconds: float) -> ExecutionOutput:
             execution_time_ms=elapsed
         )
     except Exception as e:
-        elapsed = int((asyncio.get_event_loop().time() - start) * 1000)
+        elapsed = _elapsed_ms(start)
 
-        return ExecutionOutput(
+        return ExecutionOutput.model_construct(
             action="wait",
             args={"seconds": seconds},
             status="failure",
@@ -54,63 +54,67 @@ print("=" * 60)
 
 for event in app.stream(initial_input, config):
     for node_name, state_update in event.items():
-        print(f"\n{'-' * 40}")
-        print(f"[NODE]: {node_name.upper()}")
-        print(f"{'-' * 40}")
+        # Collect this node's report and write it in one go
+        out = [
+            f"\n{'-' * 40}",
+            f"[NODE]: {node_name.upper()}",
+            f"{'-' * 40}",
+        ]
         
         # Show the plan if created/updated
         if "current_plan" in state_update and state_update["current_plan"]:
-            print("  PLAN:")
+            out.append("  PLAN:")
             for i, step in enumerate(state_update["current_plan"]):
                 marker = ">>>" if i == state_update.get("current_step_index", 0) else "   "
-                print(f"    {marker} {i+1}. {step}")
+                out.append(f"    {marker} {i+1}. {step}")
         
         # Check the Orchestrator's plan logic
         if "plan_status" in state_update:
-            print(f"  Plan Status: {state_update['plan_status']}")
+            out.append(f"  Plan Status: {state_update['plan_status']}")
         
         # Show step progress
         if "current_step_index" in state_update:
-            print(f"  Current Step: {state_update['current_step_index'] + 1}")
+            out.append(f"  Current Step: {state_update['current_step_index'] + 1}")
             
         # Show reasoning if available
         if "reasoning_log" in state_update and state_update["reasoning_log"]:
             latest_reasoning = state_update["reasoning_log"][-1]
             # Truncate long reasoning for display
             if len(latest_reasoning) > 200:
-                print(f"  Reasoning: {latest_reasoning[:200]}...")
+                out.append(f"  Reasoning: {latest_reasoning[:200]}...")
             else:
-                print(f"  Reasoning: {latest_reasoning}")
+                out.append(f"  Reasoning: {latest_reasoning}")
             
         # Check the Execution handoff
         if "current_task" in state_update:
-            print(f"  Current Task: {state_update['current_task']}")
+            out.append(f"  Current Task: {state_update['current_task']}")
             
         # Check completion status
         if "is_complete" in state_update:
-            print(f"  Is Complete: {state_update['is_complete']}")
+            out.append(f"  Is Complete: {state_update['is_complete']}")
             
         # Check fallback status
         if "needs_fallback" in state_update:
-            print(f"  Needs Fallback: {state_update['needs_fallback']}")
+            out.append(f"  Needs Fallback: {state_update['needs_fallback']}")
             
         # Show final message if from interaction agent
         if "messages" in state_update and node_name == "interaction":
-            print(f"\n  {'*' * 30}")
-            print("  FINAL RESPONSE TO USER:")
-            print(f"  {'*' * 30}")
+            out.append(f"\n  {'*' * 30}")
+            out.append("  FINAL RESPONSE TO USER:")
+            out.append(f"  {'*' * 30}")
             for msg in state_update["messages"]:
                 if isinstance(msg, dict):
                     content = msg.get("content", "")
                 else:
                     content = str(msg)
                 # Indent the final response
-                for line in content.split("\n"):
-                    print(f"  {line}")
+                out.extend(f"  {line}" for line in content.split("\n"))
         
         # Show transaction count
         if "number_of_transactions" in state_update:
-            print(f"  Transactions Completed: {state_update['number_of_transactions']}")
+            out.append(f"  Transactions Completed: {state_update['number_of_transactions']}")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
 print("\n" + "=" * 60)
 print("SIMULATION COMPLETE")
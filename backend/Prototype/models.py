@@ -8,6 +8,7 @@ from dotenv import load_dotenv
 from pydantic import BaseModel
 from typing import Type, Optional, Literal
 from dataclasses import dataclass
+from functools import lru_cache
 
 load_dotenv()
 
@@ -101,21 +102,13 @@ def _get_llm_class(provider: str):
         raise ValueError(f"Unknown provider: {provider}")
 
 
-def get_llm(
-    schema: Optional[Type[BaseModel]] = None,
-    temperature: float = 0.3,
-    model_key: str = "gemini-flash",
-):
+@lru_cache(maxsize=16)
+def _get_base_llm(model_key: str, temperature: float):
     """
-    Factory function to create configured LLM instances.
-    
-    Args:
-        schema: Pydantic model for structured output (optional)
-        temperature: Creativity level (0.0 = deterministic, 1.0 = creative)
-        model_key: Key from MODELS dict (e.g., "gemini-flash", "gpt-4o")
+    Build (once) the base LLM client for a model/temperature pair.
     
-    Returns:
-        Configured LLM instance
+    Agents sharing a configuration reuse the same client and its HTTP
+    connection pool; structured-output wrappers are layered on top per schema.
     """
     config = MODELS[model_key]
     api_key = os.getenv(config.api_key_env)
@@ -125,11 +118,35 @@ def get_llm(
     
     LLMClass = _get_llm_class(config.provider)
     
-    llm = LLMClass(
+    return LLMClass(
         model=config.name,
         temperature=temperature,
         api_key=api_key,
     )
+
+
+def get_llm(
+    schema: Optional[Type[BaseModel]] = None,
+    temperature: float = 0.3,
+    model_key: str = "gemini-flash",
+):
+    """
+    Get a configured LLM for a model/temperature pair.
+    
+    The base client is cached and shared by every caller with the same
+    model_key and temperature, so treat it as read-only: do not mutate or
+    reconfigure the returned object.
+    
+    Args:
+        schema: Pydantic model for structured output (optional)
+        temperature: Creativity level (0.0 = deterministic, 1.0 = creative)
+        model_key: Key from MODELS dict (e.g., "gemini-flash", "gpt-4o")
+    
+    Returns:
+        The shared base LLM when schema is None, otherwise a new
+        structured-output wrapper around it
+    """
+    llm = _get_base_llm(model_key, temperature)
     
     if schema:
         return llm.with_structured_output(schema)
@@ -47,16 +47,17 @@ def list_available_prompts() -> list[str]:
     Returns:
         List of prompt names (without .prompt.md extension)
     """
-    if not _PROMPTS_DIR.exists():
+    # One directory read; no separate exists() check or per-file Path objects
+    try:
+        with os.scandir(_PROMPTS_DIR) as entries:
+            # Remove the .prompt.md extension
+            return sorted(
+                entry.name.removesuffix(".prompt.md")
+                for entry in entries
+                if entry.name.endswith(".prompt.md")
+            )
+    except FileNotFoundError:
         return []
-    
-    prompts = []
-    for file in _PROMPTS_DIR.glob("*.prompt.md"):
-        # Remove the .prompt.md extension
-        name = file.stem.replace(".prompt", "")
-        prompts.append(name)
-    
-    return sorted(prompts)
 
 
 def get_prompts_directory() -> Path:
@@ -18,6 +18,18 @@ from .handlers import (
 )
 
 
+# Action type -> handler, built once at import rather than per dispatch
+ACTION_HANDLERS = {
+    "navigate": lambda page, args: handle_navigate(page, args.url),
+    "click": lambda page, args: handle_click(page, args.role, args.name),
+    "type": lambda page, args: handle_type(page, args.text),
+    "search": lambda page, args: handle_search(page, args.text),
+    "scroll": lambda page, args: handle_scroll(page, args.direction),
+    "press_key": lambda page, args: handle_press_key(page, args.key),
+    "wait": lambda page, args: handle_wait(page, args.seconds)
+}
+
+
 async def dispatch_action(page: Page, action: Action) -> ExecutionOutput:
     """
     Route action to appropriate handler based on action type.
@@ -37,19 +49,8 @@ async def dispatch_action(page: Page, action: Action) -> ExecutionOutput:
         >>> action = Action(action="click", args=ActionArgs(role="button", name="Search"))
         >>> result = await dispatch_action(page, action)
     """
-    # Define handler mapping
-    handlers = {
-        "navigate": lambda: handle_navigate(page, action.args.url),
-        "click": lambda: handle_click(page, action.args.role, action.args.name),
-        "type": lambda: handle_type(page, action.args.text),
-        "search": lambda: handle_search(page, action.args.text),
-        "scroll": lambda: handle_scroll(page, action.args.direction),
-        "press_key": lambda: handle_press_key(page, action.args.key),
-        "wait": lambda: handle_wait(page, action.args.seconds)
-    }
-
     # Get handler for the action
-    handler = handlers.get(action.action)
+    handler = ACTION_HANDLERS.get(action.action)
 
     # Handle unknown action types
     if not handler:
@@ -63,4 +64,4 @@ async def dispatch_action(page: Page, action: Action) -> ExecutionOutput:
         )
 
     # Execute the handler
-    return await handler()
+    return await handler(page, action.args)
@@ -1,9 +1,9 @@
 from openai import OpenAI
 from dotenv import load_dotenv
 import asyncio
-import pyautogui
-from playwright.async_api import async_playwright, Playwright
+from playwright.async_api import async_playwright, Playwright, Error as PlaywrightError
 import random
+import re
 from pathlib import Path
 import json
 # from agentic-tools import * # for tools for the agent to call for future implementation
@@ -150,96 +150,103 @@ The agent may only choose from these tools.
 # === type in random intervals function ===
 # ensures each letter is typed at random intervals
 async def type_in_random_intervals(message):
+    # imported here: pyautogui is slow to import and needs a display
+    import pyautogui
+
     for ch in message:
         pyautogui.typewrite(ch)
         await asyncio.sleep(random.uniform(0.02, 0.2))
 
+# matches one numbered step per line, e.g. "1. Search Google for..." → "Search Google for..."
+STEP_PATTERN = re.compile(r"^[ \t]*\d+\.[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
 # parses steps from steps agent output to create array from steps
 def parse_numbered_steps(text):
-    steps = []
-    for line in text.split("\n"):
-        line = line.strip()
-        if line.startswith(tuple(str(i) for i in range(1, 10))):
-            # Example: "1. Search Google for..." → keep text after "1. "
-            step_text = line.split(".", 1)[1].strip()
-            steps.append(step_text)
-    return steps
+    return STEP_PATTERN.findall(text)
 
-# === execute action function ===
-# executes action that model decided on
-async def execute_action(page, action, role, name, target):
+# === action functions ===
+# one per action the model can decide on, looked up in ACTIONS by execute_action
+# 1. NAVIGATE
+async def navigate_action(page, role, name, target):
+    await page.goto(target)
 
-    # 1. NAVIGATE
-    if action == "navigate":
-        await page.goto(target)
-        return
-
-    # 2. CLICK
-    if action == "click":
-
-        # Preferred: explicit role + name
-        if role and name:
-            try:
-                await page.get_by_role(role, name=name).click(timeout=3000)
-                return
-            except:
-                print(f"[!] Failed role+name click, trying fallback...")
+# 2. CLICK
+async def click_action(page, role, name, target):
 
-        # Try role alone
-        if role:
-            try:
-                await page.get_by_role(role).click(timeout=3000)
-                return
-            except:
-                pass
-
-        # Try name alone (visible text)
-        if name:
-            try:
-                await page.get_by_text(name).click(timeout=3000)
-                return
-            except:
-                pass
-
-        print(f"[!] Could not click element: role={role}, name={name}")
-        return
-
-    # 3. TYPE
-    if action == "type":
-        await page.keyboard.type(target)
-        return
-
-    # 4. SEARCH
-    if action == "search":
+    # Preferred: explicit role + name
+    if role and name:
         try:
-            search_box = page.get_by_role("combobox", name="Search")
-            await search_box.click()
-            await search_box.fill(target)
-            await page.keyboard.press("Enter")
-            return
-        except:
-            await page.keyboard.type(target)
-            await page.keyboard.press("Enter")
+            await page.get_by_role(role, name=name).click(timeout=3000)
             return
+        except PlaywrightError:
+            print(f"[!] Failed role+name click, trying fallback...")
 
-    # 5. SCROLL
-    if action == "scroll":
-        direction = target.lower()
-        delta = 800 if direction == "down" else -800
-        await page.mouse.wheel(0, delta)
-        return
+    # Try role alone
+    if role:
+        try:
+            await page.get_by_role(role).click(timeout=3000)
+            return
+        except PlaywrightError:
+            pass
 
-    # 6. PRESS_KEY
-    if action == "press_key":
-        await page.keyboard.press(target)
-        return
+    # Try name alone (visible text)
+    if name:
+        try:
+            await page.get_by_text(name).click(timeout=3000)
+            return
+        except PlaywrightError:
+            pass
+
+    print(f"[!] Could not click element: role={role}, name={name}")
+
+# 3. TYPE
+async def type_action(page, role, name, target):
+    await page.keyboard.type(target)
+
+# 4. SEARCH
+async def search_action(page, role, name, target):
+    try:
+        # fill() already waits for and focuses the box, so no separate click
+        await page.get_by_role("combobox", name="Search").fill(target)
+        await page.keyboard.press("Enter")
+    except PlaywrightError:
+        await page.keyboard.type(target)
+        await page.keyboard.press("Enter")
+
+# 5. SCROLL
+async def scroll_action(page, role, name, target):
+    direction = target.lower()
+    delta = 800 if direction == "down" else -800
+    await page.mouse.wheel(0, delta)
+
+# 6. PRESS_KEY
+async def press_key_action(page, role, name, target):
+    await page.keyboard.press(target)
+
+# 7. WAIT
+async def wait_action(page, role, name, target):
+    await asyncio.sleep(float(target))
+
+# action name -> function, built once instead of walking an if-chain per step
+ACTIONS = {
+    "navigate": navigate_action,
+    "click": click_action,
+    "type": type_action,
+    "search": search_action,
+    "scroll": scroll_action,
+    "press_key": press_key_action,
+    "wait": wait_action,
+}
 
-    # 7. WAIT
-    if action == "wait":
-        await asyncio.sleep(float(target))
+# === execute action function ===
+# executes action that model decided on
+async def execute_action(page, action, role, name, target):
+    handler = ACTIONS.get(action)
+    if handler is None:
+        print(f"[!] Unknown action: {action}")
         return
 
-    print(f"[!] Unknown action: {action}")
+    await handler(page, role, name, target)
 #! ===== SUPPORT FUNCTIONS END =====
 #
 #
@@ -255,24 +262,10 @@ def generate_llm_input(current_page):
     
     print(response.output_text)
     return response.output_text
-#! ===== ORCHESTRATION SUPPORT END =====
-#
-#
-#
 
-# === (driver) main function ===
-# asks the user for initial input
-async def main():
-    #
-    #
-    #* ORCHESTRATION
-    #! ===== ORCHESTRATION START =====    
-    # take initial user input and send it to the model
-    user_input = input("What would you like out of this browsing session?\nYour input: ")
-
-    # initialize site to start from. the site which will change over time as we continue to navigate the internet
-    web_url = "https://google.com" # this will be referred to as "page.url" from now on
-    
+# === plan session function ===
+# generates the main goal and the list of steps for the session (blocking, run it off the event loop)
+def plan_session(user_input):
     # generate the main goal of the session based on the user's initial input 
     main_goal = client.responses.create(
         model = "o4-mini-2025-04-16", 
@@ -295,6 +288,27 @@ async def main():
             {"role": "user", "content": main_goal.output_text},
         ]
     )
+    return main_goal, llm_steps
+#! ===== ORCHESTRATION SUPPORT END =====
+#
+#
+#
+
+# === (driver) main function ===
+# asks the user for initial input
+async def main():
+    #
+    #
+    #* ORCHESTRATION
+    #! ===== ORCHESTRATION START =====    
+    # take initial user input and send it to the model
+    user_input = input("What would you like out of this browsing session?\nYour input: ")
+
+    # initialize site to start from. the site which will change over time as we continue to navigate the internet
+    web_url = "https://google.com" # this will be referred to as "page.url" from now on
+    
+    # plan in a worker thread so the browser can start up at the same time
+    planning = asyncio.create_task(asyncio.to_thread(plan_session, user_input))
     #! ===== ORCHESTRATION END =====
     #
     #
@@ -305,6 +319,9 @@ async def main():
         browser = await p.chromium.launch(headless=False)
         page = await browser.new_page()
         await page.goto(web_url)
+
+        # wait for the plan before executing anything
+        main_goal, llm_steps = await planning
     
         # make the steps list into an array that we can iterate through
         steps_list = parse_numbered_steps(llm_steps.output_text)
@@ -323,8 +340,9 @@ async def main():
             # for now, extract compressed DOM 
             # print("Getting DOM elements from current page...")
             compressed_dom = await page.accessibility.snapshot(root=None, interesting_only=True)
-            compressed_dom_str = json.dumps(compressed_dom, indent=2)
-            print(compressed_dom)
+            # compact separators: the string only feeds the prompt, indentation just adds bytes and tokens
+            compressed_dom_str = json.dumps(compressed_dom, separators=(",", ":"))
+            print(compressed_dom_str)
             print(f"Compressed DOM recieved from {page.url}!")
 
             # based on the current page we are on, generate a list of actions (in order from first to last) that will bring us to the next step of completion
@@ -347,7 +365,7 @@ async def main():
             try:
                 action_data = json.loads(current_step.output_text)
                 
-            except:
+            except json.JSONDecodeError:
                 print("[!] LLM output is not valid JSON")
                 print(current_step.output_text)
                 continue
@@ -68,9 +68,9 @@ Generate a user-facing response based on this information.
         else:  # request
             final_message = response.message
             if response.requested_fields:
-                final_message += "\n\nPlease provide:"
-                for field in response.requested_fields:
-                    final_message += f"\n- {field}"
+                final_message += "\n\nPlease provide:" + "".join(
+                    f"\n- {field}" for field in response.requested_fields
+                )
         
         interaction_log = (
             f"[Interaction] Type: {response.type}\n"
@@ -36,6 +36,23 @@ Decide:
 IMPORTANT: Only mark complete when the FINAL step is done and verified.
 """
 
+# Simulated page descriptions, one per plan step
+UCF_LOGIN_STAGES = (
+    "UCF homepage loaded. 'myUCF' login link visible in navigation. Search box and menu items present.",
+    "Login page displayed. Username field (id='username'), password field (id='password'), 'Sign In' button visible.",
+    "Username entered successfully. Field shows masked input. Password field ready for input.",
+    "Password entered successfully. Both fields filled. 'Sign In' button ready to click.",
+    "Login successful! Dashboard showing student name, course schedule, Canvas and Knights Email links."
+)
+
+GENERIC_STAGES = (
+    "Page loaded at {url}. Navigation and content elements visible.",
+    "Interacted with page. Elements responding to actions.",
+    "Progress made. Page state updated.",
+    "Near completion. Final actions pending.",
+    "Task completed successfully."
+)
+
 
 class Orchestrator:
     """
@@ -99,9 +116,9 @@ Based on this request, create a plan following the output format specified.
         
         # Handle clarification requests
         if plan.needs_clarification:
-            reasoning = f"[Planner] Needs clarification:\n"
-            for q in plan.clarifying_questions:
-                reasoning += f"  - {q}\n"
+            reasoning = "[Planner] Needs clarification:\n" + "".join(
+                f"  - {q}\n" for q in plan.clarifying_questions
+            )
             
             return {
                 "number_of_transactions": state.get("number_of_transactions", 0) + 1,
@@ -116,10 +133,10 @@ Based on this request, create a plan following the output format specified.
             }
         
         # Build reasoning log
-        reasoning = f"[Planner] Goal: {plan.goal}\n"
-        reasoning += f"[Planner] Created plan with {len(plan.steps)} steps:\n"
-        for i, step in enumerate(plan.steps):
-            reasoning += f"  {i+1}. {step}\n"
+        reasoning = (
+            f"[Planner] Goal: {plan.goal}\n"
+            f"[Planner] Created plan with {len(plan.steps)} steps:\n"
+        ) + "".join(f"  {i+1}. {step}\n" for i, step in enumerate(plan.steps))
         
         return {
             "number_of_transactions": state.get("number_of_transactions", 0) + 1,
@@ -201,20 +218,8 @@ Based on this, decide what to do next.
         """Generate simulated page descriptions for testing."""
         
         if "ucf" in url.lower() or "login" in intent.lower():
-            stages = [
-                "UCF homepage loaded. 'myUCF' login link visible in navigation. Search box and menu items present.",
-                "Login page displayed. Username field (id='username'), password field (id='password'), 'Sign In' button visible.",
-                "Username entered successfully. Field shows masked input. Password field ready for input.",
-                "Password entered successfully. Both fields filled. 'Sign In' button ready to click.",
-                "Login successful! Dashboard showing student name, course schedule, Canvas and Knights Email links."
-            ]
+            stages = UCF_LOGIN_STAGES
         else:
-            stages = [
-                f"Page loaded at {url}. Navigation and content elements visible.",
-                "Interacted with page. Elements responding to actions.",
-                "Progress made. Page state updated.",
-                "Near completion. Final actions pending.",
-                "Task completed successfully."
-            ]
-        
-        return stages[min(step, len(stages) - 1)]
+            stages = GENERIC_STAGES
+        
+        return stages[min(step, len(stages) - 1)].format(url=url)
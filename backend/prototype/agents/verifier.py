@@ -110,7 +110,8 @@ Verify if the action was successful based on this information.
                 "\nNote: An overlay modal appeared blocking the target element."
             )
         
-        if "click" in task.lower() and "login" in task.lower():
+        task_lower = task.lower()
+        if "click" in task_lower and "login" in task_lower:
             return (
                 "DOM_SNAPSHOT:\n"
                 "[role='main']\n"
@@ -120,7 +121,7 @@ Verify if the action was successful based on this information.
                 "  [role='link'] 'Knights Email'\n"
                 "\nLogin button was clicked. Page is now showing the dashboard."
             )
-        elif "username" in task.lower() or "enter" in task.lower():
+        elif "username" in task_lower or "enter" in task_lower:
             return (
                 "DOM_SNAPSHOT:\n"
                 "[role='textbox'] 'username' value='student@ucf.edu'\n"
@@ -128,7 +129,7 @@ Verify if the action was successful based on this information.
                 "[role='button'] 'Sign In'\n"
                 "\nText was successfully entered into the input field."
             )
-        elif "navigate" in task.lower():
+        elif "navigate" in task_lower:
             return (
                 "DOM_SNAPSHOT:\n"
                 "[role='main']\n"
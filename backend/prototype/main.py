@@ -4,31 +4,10 @@ from agents.verifier import Verifier
 from agents.fallback import Fallback
 from agents.interaction import InteractionAgent
 from state import ProjectState
-from google import genai
 
 from agents.executor import Executor
 
 
-client = genai.Client()
-
-
-# helper to grab text from the md files in the prompts folder
-def read_markdown_file(file_path): 
-    try: 
-        with open(file_path, 'r', encoding='utf-8') as f: 
-            markdown_text = f.read()
-        return markdown_text
-    except FileNotFoundError:
-        return f"Error: {file_path} was not found."
-
-# prompts
-orchestration_prompt = read_markdown_file('backend\\prototype\\prompts\\orchestration.prompt.md')
-execution_prompt = read_markdown_file('backend\\prototype\\prompts\\execution.prompt.md')
-verification_prompt = read_markdown_file('backend\\prototype\prompts\\verification.prompt.md')
-fallback_prompt = read_markdown_file('backend\\prototype\\prompts\\fallback.prompt.md')
-interaction_prompt = read_markdown_file('backend\\prototype\\prompts\\interaction.prompt.md')
-# === prompts end ===
-
 # TODO: Add human-in-the-loop. Make sure to finish current first.
 # todo: grab user input from frontend
 user_input = "example text"
@@ -20,21 +20,20 @@ from dotenv import load_dotenv
 
 # For starting main or app
 import subprocess
+import asyncio
 
 # For password hashing
 import bcrypt
 
-# Emailing
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-
 # Random Password Generation
 import secrets
 
 # For copying sys env variables
 import sys
 
+# Logging
+import logging
+
 
 """
 To-DO List:
@@ -44,8 +43,13 @@ To-DO List:
 # Global Variables
 conn = None #postgres connection
 cur = None #postgres terminal cursor
-userdb_config_path = 'configs/user_db_config.yaml'
+base_dir = os.path.dirname(os.path.abspath(__file__)) # resolved once, independent of the cwd
+userdb_config_path = os.path.join(base_dir, 'configs', 'user_db_config.yaml')
+# NOTE: app.py imports main.py and most agents from the lowercase prototype/ folder,
+# so the agent only starts where Prototype/ and prototype/ resolve to the same directory
+agent_app_path = os.path.join(base_dir, 'Prototype', 'app.py')
 userdb_config = None
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -108,18 +112,28 @@ app.add_middleware(
 Helper Functions
 """
 def user_exists(username: str, email: str) -> bool:
-    query = 'SELECT * FROM users WHERE username = %s OR email = %s;'
+    query = 'SELECT 1 FROM users WHERE username = %s OR email = %s LIMIT 1;'
     cur.execute(query, (username, email))
     results = cur.fetchone()
     return results is not None
 
 def user_exists_id(userId: int) -> bool:
-    query = 'SELECT * FROM users WHERE user_id = %s;'
+    query = 'SELECT 1 FROM users WHERE user_id = %s;'
     cur.execute(query, (str(userId),))
     results = cur.fetchone()
     return results is not None
 
+def hash_password(password: str) -> str:
+    # Salt is fixed per deployment so hashes can be matched in SQL lookups
+    salt = os.getenv('BCRYPT_SALT').encode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
 def send_forgot_password(to_email: str, new_password: str) -> None:
+    # Emailing, imported here since only password resets need it
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
     from_email = os.getenv('EMAIL_ACCOUNT')
     from_password = os.getenv('EMAIL_PASSWORD')
 
@@ -140,9 +154,9 @@ def send_forgot_password(to_email: str, new_password: str) -> None:
         text = msg.as_string()
         server.sendmail(from_email, to_email, text)
         server.quit()
-        print(f"Password reset email sent to {to_email}")
+        logger.info("Password reset email sent to %s", to_email)
     except Exception as e:
-        print(f"Failed to send email: {e}")
+        logger.warning("Failed to send email: %s", e)
 
 
 """
@@ -203,8 +217,7 @@ async def insert_user(request: Request):
     
     # Inserting the new user
     query = 'INSERT INTO users (username, firstname, lastname, email, password, isverified) VALUES (%s, %s, %s, %s, %s, %s) RETURNING user_id;'
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), os.getenv('BCRYPT_SALT').encode('utf-8'))
-    hashed_password = hashed_password.decode('utf-8')
+    hashed_password = hash_password(password)
     cur.execute(query, (username, firstname, lastname, email, hashed_password, False))
     newUserId = cur.fetchone()[0]
     return {'userId': newUserId, 'error': error}
@@ -284,27 +297,32 @@ async def update_user(request: Request):
         error = 'No User Found with the Given UserId'
         return {'error' : error}
     
+    # Collect every changed column so the update is a single round trip
+    assignments = []
+    params = []
     if username is not None:
-        query = 'UPDATE users SET username = %s WHERE user_id = %s;'
-        cur.execute(query, (username, str(userId)))
+        assignments.append('username = %s')
+        params.append(username)
     if firstname is not None:
-        query = 'UPDATE users SET firstname = %s WHERE user_id = %s;'
-        cur.execute(query, (firstname, str(userId)))
+        assignments.append('firstname = %s')
+        params.append(firstname)
     if lastname is not None:
-        query = 'UPDATE users SET lastname = %s WHERE user_id = %s;'
-        cur.execute(query, (lastname, str(userId)))
+        assignments.append('lastname = %s')
+        params.append(lastname)
     if email is not None:
-        query = 'UPDATE users SET email = %s WHERE user_id = %s;'
-        cur.execute(query, (email, str(userId)))
+        assignments.append('email = %s')
+        params.append(email)
     if password is not None:
-        query = 'UPDATE users SET password = %s, chng_pass = false WHERE user_id = %s;'
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), os.getenv('BCRYPT_SALT').encode('utf-8'))
-        hashed_password = hashed_password.decode('utf-8')
-        cur.execute(query, (hashed_password, str(userId)))
+        assignments.append('password = %s, chng_pass = false')
+        params.append(hash_password(password))
         pass_updated = True
     
-    query = 'SELECT * FROM users WHERE user_id = %s;'
-    cur.execute(query, (str(userId),))
+    if assignments:
+        query = f'UPDATE users SET {", ".join(assignments)} WHERE user_id = %s RETURNING *;'
+        cur.execute(query, (*params, str(userId)))
+    else:
+        query = 'SELECT * FROM users WHERE user_id = %s;'
+        cur.execute(query, (str(userId),))
     results = cur.fetchone()
     if results is not None:
         user_id, username, firstname, lastname, email, _, _, _, _ = results
@@ -332,16 +350,11 @@ async def login_user(request: Request):
     username = body['username']
     password = body['password']
 
-    print(password)
-
     if username == '' or password == '':
         error = 'Username or Password is Missing'
         return {'error' : error}
     
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), os.getenv('BCRYPT_SALT').encode('utf-8'))
-    hashed_password = hashed_password.decode('utf-8')
-    
-    print(hashed_password)
+    hashed_password = hash_password(password)
 
     query = 'SELECT * FROM users WHERE username = %s AND password = %s;'
     cur.execute(query, (username, hashed_password))
@@ -393,8 +406,7 @@ async def forgot_password(request: Request):
         email = results[0]
         userId = results[1]
         new_password = secrets.token_hex(6) # Generate a secure random password
-        hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), os.getenv('BCRYPT_SALT').encode('utf-8'))
-        hashed_password = hashed_password.decode('utf-8')
+        hashed_password = hash_password(new_password)
         query = 'UPDATE users SET password = %s, chng_pass = true WHERE user_id = %s;'
         cur.execute(query, (hashed_password, str(userId)))
         send_forgot_password(email, new_password)
@@ -429,8 +441,10 @@ async def start_agent(requests: Request):
     current_env = os.environ.copy()
     python_path = sys.executable
 
-    result = subprocess.run(
-        [python_path, 'Prototype\\app.py', user_input],
+    # run the agent in a worker thread so the event loop keeps serving requests
+    result = await asyncio.to_thread(
+        subprocess.run,
+        [python_path, agent_app_path, user_input],
         env=current_env,
         capture_output=True,
         text=True
@@ -1,26 +1,49 @@
 """
 Pytest configuration and fixtures for execution tests.
+
+One Chromium instance is launched per test session and shared by all tests;
+each test still gets its own fresh browser context and page, so cookies,
+storage and page state do not leak between tests. The browser lives on the
+session event loop, so every async test is moved onto that loop as well.
 """
 
+import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from playwright.async_api import async_playwright
 
 
-@pytest_asyncio.fixture(scope="function")
-async def page():
-    """
-    Provide a Playwright page for testing.
+def pytest_collection_modifyitems(items):
+    """Run all async tests on the session event loop the shared browser lives on."""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
 
-    Creates a new browser instance for each test (slower but most reliable).
-    Typical run time: ~2.5 seconds per test, ~42 seconds for 17 tests total.
-    """
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    """Launch one headless Chromium for the whole test session."""
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
 
-        yield page
+        yield browser
 
-        await page.close()
-        await context.close()
         await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser):
+    """
+    Provide a Playwright page for testing.
+
+    Each test gets a new, isolated context on the shared browser, which
+    is far cheaper than launching a browser per test.
+    """
+    context = await browser.new_context()
+    page = await context.new_page()
+
+    yield page
+
+    await page.close()
+    await context.close()
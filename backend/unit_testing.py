@@ -46,19 +46,24 @@ def env_and_db_monkeypatch(monkeypatch):
     yield
 
 
+@pytest.fixture(scope='module')
+def client():
+    # One client for the whole module; the per-test state lives in the monkeypatched cursor
+    return TestClient(server.app)
+
+
 def make_token(user_id: int = 1):
     secret = os.getenv('TOKEN_SECRET')
     payload = {'user_id': user_id, 'username': 'u', 'firstname': 'f', 'lastname': 'l'}
     return jwt.encode(payload, secret, algorithm='HS256')
 
 
-def test_get_user_success(monkeypatch):
+def test_get_user_success(monkeypatch, client):
     # Prepare a cursor that will return a single user row
     user_row = (1, 'user1', 'First', 'Last', 'email@example.com', 'pw', False, False, False)
     mock_cur = MockCursor(fetchone_results=[user_row])
     monkeypatch.setattr(server, 'cur', mock_cur)
 
-    client = TestClient(server.app)
     resp = client.get('/api/users/?userId=1')
     assert resp.status_code == 200
     data = resp.json()
@@ -66,30 +71,27 @@ def test_get_user_success(monkeypatch):
     assert data['username'] == 'user1'
 
 
-def test_get_user_missing_userid(monkeypatch):
+def test_get_user_missing_userid(monkeypatch, client):
     mock_cur = MockCursor()
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     resp = client.get('/api/users/')
     assert resp.status_code == 200
     assert resp.json()['error'] == 'No UserId Specified'
 
 
-def test_get_user_invalid_userid(monkeypatch):
+def test_get_user_invalid_userid(monkeypatch, client):
     mock_cur = MockCursor()
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     resp = client.get('/api/users/?userId=0')
     assert resp.status_code == 200
     assert resp.json()['error'] == 'UserId is Invalid'
 
 
-def test_insert_user_success(monkeypatch):
+def test_insert_user_success(monkeypatch, client):
     # Sequence: user_exists -> None (no user), then INSERT returns (newId,)
     mock_cur = MockCursor(fetchone_results=[None, (42,)])
     monkeypatch.setattr(server, 'cur', mock_cur)
 
-    client = TestClient(server.app)
     body = {
         'username': 'newuser',
         'firstname': 'New',
@@ -103,21 +105,19 @@ def test_insert_user_success(monkeypatch):
     assert data['userId'] == 42
 
 
-def test_insert_user_missing_fields(monkeypatch):
+def test_insert_user_missing_fields(monkeypatch, client):
     mock_cur = MockCursor()
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     body = {'username': 'u', 'firstname': ''}
     resp = client.post('/api/users/insert/', json=body)
     assert resp.status_code == 200
     assert resp.json()['error'] == 'One or More Required Fields are Missing'
 
 
-def test_insert_user_existing(monkeypatch):
+def test_insert_user_existing(monkeypatch, client):
     # user_exists returns a non-empty row
     mock_cur = MockCursor(fetchone_results=[(1, 'exists')])
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     body = {
         'username': 'exists',
         'firstname': 'E',
@@ -130,12 +130,11 @@ def test_insert_user_existing(monkeypatch):
     assert resp.json()['error'] == 'Username or Email Already Exists'
 
 
-def test_login_user_success(monkeypatch):
+def test_login_user_success(monkeypatch, client):
     # login hashes password then SELECT should return a user row
     user_row = (1, 'user1', 'First', 'Last', 'email', 'pw', False, False, False)
     mock_cur = MockCursor(fetchone_results=[user_row])
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     body = {'username': 'user1', 'password': 'pass123'}
     resp = client.post('/api/users/login/', json=body)
     assert resp.status_code == 200
@@ -143,44 +142,40 @@ def test_login_user_success(monkeypatch):
     assert 'token' in data
 
 
-def test_login_user_invalid(monkeypatch):
+def test_login_user_invalid(monkeypatch, client):
     mock_cur = MockCursor(fetchone_results=[None])
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     body = {'username': 'bad', 'password': 'bad'}
     resp = client.post('/api/users/login/', json=body)
     assert resp.status_code == 200
     assert resp.json()['error'] == 'Invalid Username or Password'
 
 
-def test_delete_user_success(monkeypatch):
+def test_delete_user_success(monkeypatch, client):
     # decode token -> user_id 1, user_exists_id returns a row
     mock_cur = MockCursor(fetchone_results=[(1, 'u')])
     monkeypatch.setattr(server, 'cur', mock_cur)
     token = make_token(1)
-    client = TestClient(server.app)
     headers = {'authorization': f'Bearer {token}'}
     resp = client.delete('/api/users/delete/', headers=headers)
     assert resp.status_code == 200
     assert resp.json().get('error', '') == ''
 
 
-def test_delete_user_no_token(monkeypatch):
+def test_delete_user_no_token(monkeypatch, client):
     mock_cur = MockCursor()
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     resp = client.delete('/api/users/delete/')
     assert resp.status_code == 200
     assert resp.json()['error'] == 'No Token Provided'
 
 
-def test_update_user_success(monkeypatch):
+def test_update_user_success(monkeypatch, client):
     # token decode -> user_id, user_exists_id first, then final SELECT returns user row
     final_user = (1, 'userx', 'F', 'L', 'ex@example.com', 'pw', False, False, False)
     mock_cur = MockCursor(fetchone_results=[(1,), final_user])
     monkeypatch.setattr(server, 'cur', mock_cur)
     token = make_token(1)
-    client = TestClient(server.app)
     headers = {'authorization': f'Bearer {token}'}
     body = {'username': 'userx', 'firstname': 'F', 'lastname': 'L', 'email': 'ex@example.com', 'password': 'newpass'}
     resp = client.post('/api/users/update/', headers=headers, json=body)
@@ -190,20 +185,51 @@ def test_update_user_success(monkeypatch):
     assert data['passUpdated'] is True
 
 
-def test_forgot_password_success(monkeypatch):
+def test_update_user_partial_query(monkeypatch, client):
+    # only the sent columns end up in the UPDATE, with params in the same order
+    final_user = (1, 'u', 'F', 'L', 'new@example.com', 'pw', False, False, False)
+    mock_cur = MockCursor(fetchone_results=[(1,), final_user])
+    monkeypatch.setattr(server, 'cur', mock_cur)
+    token = make_token(1)
+    headers = {'authorization': f'Bearer {token}'}
+    body = {'email': 'new@example.com', 'password': 'newpass'}
+    resp = client.post('/api/users/update/', headers=headers, json=body)
+    assert resp.status_code == 200
+    assert resp.json()['passUpdated'] is True
+    query, params = mock_cur.executed[-1]
+    assert query == 'UPDATE users SET email = %s, password = %s, chng_pass = false WHERE user_id = %s RETURNING *;'
+    assert params == ('new@example.com', 'hashed-newpass', '1')
+
+
+def test_update_user_empty_body_selects(monkeypatch, client):
+    # nothing to update -> no UPDATE is issued, the user row is just read back
+    final_user = (1, 'u', 'F', 'L', 'e@example.com', 'pw', False, False, False)
+    mock_cur = MockCursor(fetchone_results=[(1,), final_user])
+    monkeypatch.setattr(server, 'cur', mock_cur)
+    token = make_token(1)
+    headers = {'authorization': f'Bearer {token}'}
+    resp = client.post('/api/users/update/', headers=headers, json={})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data['username'] == 'u'
+    assert data['passUpdated'] is False
+    query, params = mock_cur.executed[-1]
+    assert query == 'SELECT * FROM users WHERE user_id = %s;'
+    assert params == ('1',)
+
+
+def test_forgot_password_success(monkeypatch, client):
     # when username lookup returns (email, user_id)
     mock_cur = MockCursor(fetchone_results=[('user@example.com', 3)])
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     resp = client.get('/api/users/forgot-password/?username=testuser')
     assert resp.status_code == 200
     assert resp.json().get('error', '') == ''
 
 
-def test_forgot_password_missing(monkeypatch):
+def test_forgot_password_missing(monkeypatch, client):
     mock_cur = MockCursor()
     monkeypatch.setattr(server, 'cur', mock_cur)
-    client = TestClient(server.app)
     resp = client.get('/api/users/forgot-password/')
     assert resp.status_code == 200
     assert resp.json()['error'] == 'No username or email Specified'